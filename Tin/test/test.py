@@ -14,7 +14,7 @@ from gradio.themes.utils import colors, fonts, sizes # type: ignore
 from injector import inject, singleton
 from llama_index.core.llms import ChatMessage, ChatResponse, MessageRole
 from llama_index.core.types import TokenGen
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from private_gpt.constants import PROJECT_ROOT_PATH
 from private_gpt.di import global_injector
@@ -57,8 +57,7 @@ class Source(BaseModel):
     page: str
     text: str
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     @staticmethod
     def curate_sources(sources: list[Chunk]) -> list["Source"]:
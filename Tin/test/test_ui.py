@@ -1,14 +1,15 @@
 import base64
 import logging
 import time
-from collections.abc import Iterable
+import types
+from collections.abc import Iterable, Mapping
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 import gradio as gr  # type: ignore
 from gradio.themes.utils.colors import slate  # type: ignore
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,47 @@ MODES: list[Modes] = [
     Modes.SUMMARIZE_MODE,
 ]
 
+# Frozen at import time: each mode change is a single dict lookup returning
+# the (system prompt, explanation) pair, with the strings shared across
+# sessions instead of being rebuilt per event.
+_MODE_PROMPTS: Mapping[str, tuple[str, str]] = types.MappingProxyType(
+    {
+        Modes.RAG_MODE.value: (
+            "You can only answer questions about the provided context.",
+            "Get contextualized answers from selected files.",
+        ),
+        Modes.SEARCH_MODE.value: (
+            "",
+            "Find relevant chunks of text in selected files.",
+        ),
+        Modes.BASIC_CHAT_MODE.value: (
+            "You are a helpful, respectful and honest assistant.",
+            "Chat with the LLM using its training data. Files are ignored.",
+        ),
+        Modes.SUMMARIZE_MODE.value: (
+            "Provide a comprehensive summary of the provided context information.",
+            "Generate a summary of the selected files. Prompt to customize the result.",
+        ),
+    }
+)
+
+
+def _on_mode_change(mode: str) -> tuple[str, str]:
+    return _MODE_PROMPTS[mode]
+
+
+_LOGO_URL = (
+    "https://digital.fpt.com/wp-content/themes/fdx/assets/images/"
+    "branding-guideline/bg-top@3x.png"
+)
+
+# Constant header: built once at import time, and the preload hint lets the
+# browser fetch the logo in parallel with layout instead of after it
+_HEADER_HTML = (
+    f"<link rel='preload' as='image' href='{_LOGO_URL}'>"
+    f"<div class='logo'><img src='{_LOGO_URL}' loading='eager' decoding='async'/></div>"
+)
+
 
 class Source(BaseModel):
     """Represents a curated source of text, used to display chunk references."""
@@ -37,8 +79,7 @@ class Source(BaseModel):
     page: str
     text: str
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
 
@@ -146,7 +187,7 @@ hr {
         ) as blocks:
             # Header row with logo
             with gr.Row():
-                gr.HTML(f"<div class='logo'><img src='https://digital.fpt.com/wp-content/themes/fdx/assets/images/branding-guideline/bg-top@3x.png'/></div>")
+                gr.HTML(_HEADER_HTML)
             def toggle_sidebar(state):
                 state = not state
                 return gr.update(visible = state), state
@@ -260,7 +301,7 @@ hr {
 
                     # On mode change -> reset system prompt and explanation
                     mode.change(
-                        
+                        _on_mode_change,
                         inputs=mode,
                         outputs=[system_prompt_input, explanation_mode],
                     )
@@ -306,8 +347,8 @@ hr {
 
     def get_ui_blocks(self) -> gr.Blocks:
         """Return the cached or newly built Gradio Blocks."""
-        
-        self._ui_block = self._build_ui_blocks()
+        if getattr(self, "_ui_block", None) is None:
+            self._ui_block = self._build_ui_blocks()
         return self._ui_block
 
 
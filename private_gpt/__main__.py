@@ -1,5 +1,7 @@
 # start a fastapi server with uvicorn
 
+import logging
+
 import uvicorn
 
 from private_gpt.main import app
@@ -8,4 +10,21 @@ from private_gpt.settings.settings import settings
 # Set log_config=None to do not use the uvicorn logging configuration, and
 # use ours instead. For reference, see below:
 # https://github.com/tiangolo/fastapi/discussions/7457#discussioncomment-5141108
-uvicorn.run(app, host="0.0.0.0", port=settings().server.port, log_config=None)
+if settings().server.prod:
+    # uvloop + httptools replace the pure-Python event loop and HTTP
+    # parser (both ship with uvicorn[standard], pulled in by
+    # fastapi[all]), and the synchronous access-log write per request is
+    # dropped. This matters for the SSE chat endpoint, which is bound by
+    # many small writes.
+    logging.getLogger("uvicorn.access").disabled = True
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=settings().server.port,
+        log_config=None,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
+else:
+    uvicorn.run(app, host="0.0.0.0", port=settings().server.port, log_config=None)
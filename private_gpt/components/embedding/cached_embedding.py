@@ -0,0 +1,193 @@
+"""Content-addressed cache around an embedding model.
+
+Re-ingesting a document, overlapping chunks and repeated queries all ask
+the embedding model for text it has already embedded. This wrapper keys
+every embedding by a hash of its text and serves repeats from an
+in-memory LRU backed by a SQLite table, replacing an embedding forward
+pass with a hash plus a lookup. Vectors are persisted in a reduced dtype
+(float16 by default, optionally int8 with a per-vector scale) to cut disk
+I/O; the precision loss is negligible for similarity search.
+"""
+
+import asyncio
+import contextlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from pydantic import PrivateAttr
+
+from private_gpt.utils.hashing import content_key
+
+logger = logging.getLogger(__name__)
+
+_INSERT_SQL = (
+    "INSERT OR REPLACE INTO embedding_cache(key, vector, scale, dtype)"
+    " VALUES (?, ?, ?, ?)"
+)
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embedding model wrapper that caches vectors by content hash."""
+
+    _delegate: BaseEmbedding = PrivateAttr()
+    _mem: "OrderedDict[bytes, list[float]]" = PrivateAttr()
+    _mem_size: int = PrivateAttr()
+    _db: sqlite3.Connection = PrivateAttr()
+    _lock: threading.Lock = PrivateAttr()
+    _dtype: str = PrivateAttr()
+
+    def __init__(
+        self,
+        delegate: BaseEmbedding,
+        db_path: Path,
+        mem_size: int = 50_000,
+        dtype: str = "float16",
+    ) -> None:
+        super().__init__(
+            model_name=delegate.model_name,
+            embed_batch_size=delegate.embed_batch_size,
+            callback_manager=delegate.callback_manager,
+        )
+        self._delegate = delegate
+        self._mem = OrderedDict()
+        self._mem_size = mem_size
+        self._lock = threading.Lock()
+        self._dtype = dtype
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache"
+            "(key BLOB PRIMARY KEY, vector BLOB,"
+            " scale REAL, dtype TEXT NOT NULL DEFAULT 'float16')"
+        )
+        # Migrate databases created before the quantization columns existed
+        for column in ("scale REAL", "dtype TEXT NOT NULL DEFAULT 'float16'"):
+            with contextlib.suppress(sqlite3.OperationalError):
+                # OperationalError means the column is already present
+                self._db.execute(f"ALTER TABLE embedding_cache ADD COLUMN {column}")
+        self._db.commit()
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    @staticmethod
+    def _make_key(namespace: str, text: str) -> bytes:
+        # Queries and texts are cached under different namespaces: some
+        # models (e.g. nomic) prepend different instructions to each.
+        return content_key(f"{namespace}:{text}".encode())
+
+    def _encode(self, vector: list[float]) -> tuple[bytes, float | None]:
+        if self._dtype == "int8":
+            # SQ8: per-vector scale so the full int8 range is used
+            arr = np.asarray(vector, dtype=np.float32)
+            scale = float(np.max(np.abs(arr))) / 127.0 or 1.0
+            return np.round(arr / scale).astype(np.int8).tobytes(), scale
+        return np.asarray(vector, dtype=self._dtype).tobytes(), None
+
+    @staticmethod
+    def _decode(blob: bytes, scale: float | None, dtype: str) -> list[float]:
+        if dtype == "int8":
+            arr = np.frombuffer(blob, dtype=np.int8).astype(np.float32) * scale
+        else:
+            arr = np.frombuffer(blob, dtype=dtype).astype(np.float32)
+        return arr.tolist()
+
+    def _cache_get(self, key: bytes) -> list[float] | None:
+        with self._lock:
+            vector = self._mem.get(key)
+            if vector is not None:
+                self._mem.move_to_end(key)
+                return vector
+            row = self._db.execute(
+                "SELECT vector, scale, dtype FROM embedding_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        vector = self._decode(*row)
+        self._mem_put(key, vector)
+        return vector
+
+    def _mem_put(self, key: bytes, vector: list[float]) -> None:
+        with self._lock:
+            self._mem[key] = vector
+            self._mem.move_to_end(key)
+            while len(self._mem) > self._mem_size:
+                self._mem.popitem(last=False)
+
+    def _cache_put(self, key: bytes, vector: list[float]) -> None:
+        self._mem_put(key, vector)
+        blob, scale = self._encode(vector)
+        with self._lock:
+            self._db.execute(_INSERT_SQL, (key, blob, scale, self._dtype))
+            self._db.commit()
+
+    def _cache_put_many(
+        self, entries: list[tuple[bytes, list[float]]]
+    ) -> None:
+        # One transaction for the whole batch: per-row commits would pay
+        # an fsync per chunk, the exact overhead this cache removes
+        rows = []
+        for key, vector in entries:
+            self._mem_put(key, vector)
+            blob, scale = self._encode(vector)
+            rows.append((key, blob, scale, self._dtype))
+        with self._lock:
+            self._db.executemany(_INSERT_SQL, rows)
+            self._db.commit()
+
+    def _get_query_embedding(self, query: str) -> list[float]:
+        key = self._make_key("query", query)
+        vector = self._cache_get(key)
+        if vector is None:
+            vector = self._delegate._get_query_embedding(query)
+            self._cache_put(key, vector)
+        return vector
+
+    async def _aget_query_embedding(self, query: str) -> list[float]:
+        key = self._make_key("query", query)
+        # The SQLite lookup and write are blocking; keep them off the loop
+        vector = await asyncio.to_thread(self._cache_get, key)
+        if vector is None:
+            vector = await self._delegate._aget_query_embedding(query)
+            await asyncio.to_thread(self._cache_put, key, vector)
+        return vector
+
+    def _get_text_embedding(self, text: str) -> list[float]:
+        key = self._make_key("text", text)
+        vector = self._cache_get(key)
+        if vector is None:
+            vector = self._delegate._get_text_embedding(text)
+            self._cache_put(key, vector)
+        return vector
+
+    async def _aget_text_embedding(self, text: str) -> list[float]:
+        key = self._make_key("text", text)
+        vector = await asyncio.to_thread(self._cache_get, key)
+        if vector is None:
+            vector = await self._delegate._aget_text_embedding(text)
+            await asyncio.to_thread(self._cache_put, key, vector)
+        return vector
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        keys = [self._make_key("text", text) for text in texts]
+        vectors: list[list[float] | None] = [self._cache_get(key) for key in keys]
+        missing = [index for index, vector in enumerate(vectors) if vector is None]
+        if missing:
+            computed = self._delegate._get_text_embeddings(
+                [texts[index] for index in missing]
+            )
+            entries = []
+            for index, vector in zip(missing, computed, strict=True):
+                vectors[index] = vector
+                entries.append((keys[index], vector))
+            self._cache_put_many(entries)
+        return vectors  # type: ignore[return-value]
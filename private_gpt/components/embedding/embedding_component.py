@@ -30,6 +30,7 @@ class EmbeddingComponent:
 
                 self.embedding_model = HuggingFaceEmbedding(
                     model_name=settings.huggingface.embedding_hf_model_name,
+                    embed_batch_size=settings.embedding.embed_batch_size,
                     cache_folder=str(models_cache_path),
                     trust_remote_code=settings.huggingface.trust_remote_code,
                 )
@@ -45,6 +46,7 @@ class EmbeddingComponent:
 
                 self.embedding_model = SagemakerEmbedding(
                     endpoint_name=settings.sagemaker.embedding_endpoint_name,
+                    embed_batch_size=settings.embedding.embed_batch_size,
                 )
             case "openai":
                 try:
@@ -64,6 +66,7 @@ class EmbeddingComponent:
 
                 self.embedding_model = OpenAIEmbedding(
                     api_base=api_base,
+                    embed_batch_size=settings.embedding.embed_batch_size,
                     api_key=api_key,
                     model=model,
                 )
@@ -89,6 +92,7 @@ class EmbeddingComponent:
 
                 self.embedding_model = OllamaEmbedding(
                     model_name=model_name,
+                    embed_batch_size=settings.embedding.embed_batch_size,
                     base_url=ollama_settings.embedding_api_base,
                 )
 
@@ -125,6 +129,7 @@ class EmbeddingComponent:
                 azopenai_settings = settings.azopenai
                 self.embedding_model = AzureOpenAIEmbedding(
                     model=azopenai_settings.embedding_model,
+                    embed_batch_size=settings.embedding.embed_batch_size,
                     deployment_name=azopenai_settings.embedding_deployment_name,
                     api_key=azopenai_settings.api_key,
                     azure_endpoint=azopenai_settings.azure_endpoint,
@@ -142,6 +147,7 @@ class EmbeddingComponent:
 
                 self.embedding_model = GeminiEmbedding(
                     api_key=settings.gemini.api_key,
+                    embed_batch_size=settings.embedding.embed_batch_size,
                     model_name=settings.gemini.embedding_model,
                 )
             case "mistralai":
@@ -159,9 +165,24 @@ class EmbeddingComponent:
 
                 self.embedding_model = MistralAIEmbedding(
                     api_key=api_key,
+                    embed_batch_size=settings.embedding.embed_batch_size,
                     model=model,
                 )
             case "mock":
                 # Not a random number, is the dimensionality used by
                 # the default embedding model
                 self.embedding_model = MockEmbedding(384)
+
+        if settings.cache.embedding_cache_enabled and embedding_mode != "mock":
+            from private_gpt.components.embedding.cached_embedding import (
+                CachedEmbedding,
+            )
+            from private_gpt.paths import local_data_path
+
+            logger.info("Wrapping the embedding model with a content-addressed cache")
+            self.embedding_model = CachedEmbedding(
+                delegate=self.embedding_model,
+                db_path=local_data_path / "embedding_cache.db",
+                mem_size=settings.cache.embedding_cache_size,
+                dtype=settings.embedding.cache_dtype,
+            )
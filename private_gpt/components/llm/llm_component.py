@@ -75,6 +75,32 @@ class LLMComponent:
                     verbose=True,
                 )
 
+                if settings.llm.prefix_cache_enabled:
+                    try:
+                        from llama_cpp import (  # type: ignore
+                            LlamaDiskCache,
+                            LlamaRAMCache,
+                        )
+                    except ImportError as e:
+                        raise ImportError(
+                            "Local dependencies not found, install with `poetry install --extras llms-llama-cpp`"
+                        ) from e
+
+                    # Reuse the KV state of previously evaluated prompt
+                    # prefixes (system prompt, common instructions), so
+                    # identical prefixes skip prefill entirely.
+                    if settings.cache.llama_cache_dir:
+                        prompt_cache = LlamaDiskCache(
+                            cache_dir=settings.cache.llama_cache_dir
+                        )
+                    else:
+                        prompt_cache = LlamaRAMCache()
+                    self.llm._model.set_cache(prompt_cache)
+                    logger.info(
+                        "Prompt prefix caching enabled, backend=%s",
+                        "disk" if settings.cache.llama_cache_dir else "ram",
+                    )
+
             case "sagemaker":
                 try:
                     from private_gpt.components.llm.custom.sagemaker import SagemakerLLM
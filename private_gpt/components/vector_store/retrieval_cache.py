@@ -0,0 +1,128 @@
+"""Chunk-level retrieval cache.
+
+Retrieval repeats the same work for the same query across requests: one
+query-embedding forward pass plus one ANN search against the vector store.
+This component memoizes the retrieved nodes keyed by (context filter,
+top_k, query) so repeated queries skip both. In-flight lookups are
+deduplicated, which also lets callers warm the cache speculatively while
+the rest of the pipeline is being set up.
+
+The attention KV tensors of the LLM itself are not reachable from this
+codebase (every LLM backend is a llama-index API wrapper), so caching
+stops at the retrieval boundary.
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from injector import inject, singleton
+from llama_index.core.retrievers import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle
+
+from private_gpt.open_ai.extensions.context_filter import ContextFilter
+from private_gpt.settings.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[tuple[str, ...] | None, int, str]
+
+
+class CachedRetriever(BaseRetriever):
+    """Retriever wrapper that serves repeated queries from the cache."""
+
+    def __init__(
+        self,
+        retriever: BaseRetriever,
+        cache: "RetrievalCacheComponent",
+        key_prefix: tuple[tuple[str, ...] | None, int],
+    ) -> None:
+        super().__init__(callback_manager=retriever.callback_manager)
+        self._retriever = retriever
+        self._cache = cache
+        self._key_prefix = key_prefix
+
+    def _retrieve(self, query_bundle: QueryBundle) -> list[NodeWithScore]:
+        key: CacheKey = (*self._key_prefix, query_bundle.query_str)
+        return self._cache.get_or_compute(
+            key, lambda: self._retriever.retrieve(query_bundle)
+        )
+
+
+@singleton
+class RetrievalCacheComponent:
+    @inject
+    def __init__(self, settings: Settings) -> None:
+        self._max_size = settings.cache.retrieval_cache_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, list[NodeWithScore]] = OrderedDict()
+        self._in_flight: dict[CacheKey, Future[list[NodeWithScore]]] = {}
+
+    def wrap(
+        self,
+        retriever: BaseRetriever,
+        context_filter: ContextFilter | None = None,
+    ) -> BaseRetriever:
+        """Wrap a retriever so its results are cached.
+
+        The context filter is part of the cache key, given that the same
+        query against a different document selection retrieves different
+        chunks.
+        """
+        docs_ids = (
+            tuple(sorted(context_filter.docs_ids))
+            if context_filter is not None and context_filter.docs_ids is not None
+            else None
+        )
+        key_prefix = (docs_ids, getattr(retriever, "similarity_top_k", 0))
+        return CachedRetriever(retriever, self, key_prefix)
+
+    def get_or_compute(
+        self,
+        key: CacheKey,
+        compute: Callable[[], list[NodeWithScore]],
+    ) -> list[NodeWithScore]:
+        with self._lock:
+            nodes = self._entries.get(key)
+            if nodes is not None:
+                self._entries.move_to_end(key)
+                # Deep copy: the chat postprocessors mutate the nodes they
+                # are handed (set_content, score rewrites), so sharing the
+                # cached objects across requests would corrupt the entry
+                return copy.deepcopy(nodes)
+            future = self._in_flight.get(key)
+            if future is None:
+                # This caller computes; concurrent callers wait on the future
+                future = Future()
+                self._in_flight[key] = future
+                is_owner = True
+            else:
+                is_owner = False
+        if not is_owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            nodes = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            with self._lock:
+                self._in_flight.pop(key, None)
+            raise
+        with self._lock:
+            # Snapshot before the owner's pipeline gets to mutate the nodes
+            self._entries[key] = copy.deepcopy(nodes)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+            self._in_flight.pop(key, None)
+        future.set_result(nodes)
+        return nodes
+
+    def clear(self) -> None:
+        """Drop all cached retrievals, e.g. after the corpus changed."""
+        with self._lock:
+            self._entries.clear()
+        logger.debug("Retrieval cache cleared")
@@ -1,5 +1,12 @@
+import asyncio
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
+import secrets
+
+import orjson
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from injector import Injector
@@ -14,9 +21,16 @@ from private_gpt.server.health.health_router import health_router
 from private_gpt.server.ingest.ingest_router import ingest_router
 from private_gpt.server.recipes.summarize.summarize_router import summarize_router
 from private_gpt.settings.settings import Settings
+from private_gpt.settings.settings_snapshot import SettingsSnapshot
 
 def setup_logging():
-    """Configure logging to write debug logs to a .json file."""
+    """Configure logging to write debug logs to a .json file.
+
+    Records are serialized with orjson (C-backed, much faster than the
+    stdlib json for this per-record workload) and buffered in memory, so
+    the disk is hit in batches instead of once per log line. A queue
+    decouples the emitting threads from the file I/O entirely.
+    """
     class JsonFormatter(logging.Formatter):
         def format(self, record):
             log_record = {
@@ -27,17 +41,36 @@ def setup_logging():
                 "pathname": record.pathname,
                 "lineno": record.lineno,
             }
-            return json.dumps(log_record)
+            return orjson.dumps(log_record).decode()
 
     # Define logger configuration
-    handler = logging.FileHandler("lanch.json")
-    handler.setLevel(logging.DEBUG)
-    handler.setFormatter(JsonFormatter())
+    file_handler = logging.FileHandler("lanch.json")
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(JsonFormatter())
+
+    # Batch writes: records accumulate in memory and are flushed once the
+    # buffer fills up or an ERROR record arrives
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
+
+    # The emitting thread only enqueues; a listener thread does the writes
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, memory_handler)
+    listener.start()
+
+    def _flush_and_stop() -> None:
+        listener.stop()
+        memory_handler.close()
+        file_handler.close()
+
+    atexit.register(_flush_and_stop)
 
     # Get the root logger and configure it
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(handler)
+    root_logger.addHandler(queue_handler)
 
     # Optional: Suppress overly verbose logs from libraries
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -55,6 +88,12 @@ def create_app(root_injector: Injector) -> FastAPI:
 
     app = FastAPI(dependencies=[Depends(bind_injector_to_request)])
 
+    settings = root_injector.get(Settings)
+    # Frozen snapshot of the hot-path settings: plain attribute loads
+    # instead of Pydantic descriptor access on every request
+    settings_snap = SettingsSnapshot.from_settings(settings)
+    app.state.settings_snap = settings_snap
+
     app.include_router(completions_router)
     app.include_router(chat_router)
     app.include_router(chunks_router)
@@ -67,28 +106,227 @@ def create_app(root_injector: Injector) -> FastAPI:
     if global_handler:
         LlamaIndexSettings.callback_manager = CallbackManager([global_handler])
 
-    settings = root_injector.get(Settings)
-    if settings.server.cors.enabled:
-        logger.debug("Setting up CORS middleware")
+    if settings_snap.response_cache_enabled:
+        logger.debug("Setting up the response cache middleware")
+        from starlette.concurrency import run_in_threadpool
+        from starlette.responses import Response
+
+        from private_gpt.components.embedding.embedding_component import (
+            EmbeddingComponent,
+        )
+        from private_gpt.server.utils.response_cache import ResponseCacheComponent
+
+        # The ingest service shares this component and invalidates the
+        # caches on every corpus write, including the ones made by the UI
+        cache_component = root_injector.get(ResponseCacheComponent)
+        response_cache = cache_component.response_cache
+        semantic_cache = cache_component.semantic_cache
+        app.state.response_cache = response_cache
+        app.state.semantic_cache = semantic_cache
+
+        def _scope_key(data: dict) -> tuple:
+            # Everything besides the query wording that changes the answer:
+            # a paraphrase may only match within the same prompt and corpus
+            # scope, mirroring what the exact and retrieval caches key on
+            messages = data.get("messages")
+            system_prompt = None
+            if isinstance(messages, list):
+                system_prompt = next(
+                    (
+                        m.get("content")
+                        for m in messages
+                        if isinstance(m, dict) and m.get("role") == "system"
+                    ),
+                    None,
+                )
+            context_filter = data.get("context_filter")
+            docs_ids = (
+                context_filter.get("docs_ids")
+                if isinstance(context_filter, dict)
+                else None
+            )
+            return (
+                system_prompt,
+                bool(data.get("use_context")),
+                tuple(sorted(docs_ids)) if docs_ids else None,
+            )
+
+        def _last_user_message(data: dict) -> str | None:
+            messages = data.get("messages")
+            if not isinstance(messages, list):
+                return None
+            for message in reversed(messages):
+                if isinstance(message, dict) and message.get("role") == "user":
+                    return message.get("content")
+            return None
+
+        cacheable_paths = ("/v1/completions", "/v1/chat/completions")
+
+        auth_secret = (
+            settings.server.auth.secret if settings.server.auth.enabled else None
+        )
+
+        def _authorized(request: Request) -> bool:
+            # A cache hit is served before routing, so the routers'
+            # `authenticated` dependency never runs for it; replicate the
+            # simple-auth check here
+            if auth_secret is None:
+                return True
+            return secrets.compare_digest(
+                request.headers.get("Authorization", ""), auth_secret
+            )
+
+        @app.middleware("http")
+        async def cache_completion_responses(request: Request, call_next):  # type: ignore[no-untyped-def]
+            if request.method != "POST" or request.url.path not in cacheable_paths:
+                return await call_next(request)
+
+            if not _authorized(request):
+                # Let the router reject the request with the proper 401
+                return await call_next(request)
+
+            body = await request.body()
+            try:
+                data = json.loads(body)
+            except ValueError:
+                data = None
+            # Any JSON scalar/array is also a "valid" body at this point;
+            # only dicts are inspected, the router will reject the rest
+            if isinstance(data, dict) and data.get("stream"):
+                # Streaming responses are consumed as they are produced,
+                # there is no finished body to cache
+                return await call_next(request)
+
+            key = response_cache.make_key(request.url.path, body)
+            cached_body = await response_cache.get(key)
+            if cached_body is not None:
+                logger.debug("Serving response from cache for path=%s", request.url.path)
+                return Response(content=cached_body, media_type="application/json")
+
+            # Exact miss: try to match a paraphrase of a recent query
+            query_vector = None
+            query_scope = None
+            if (
+                semantic_cache is not None
+                and request.url.path == "/v1/chat/completions"
+                and isinstance(data, dict)
+            ):
+                query_text = _last_user_message(data)
+                if query_text:
+                    embedding_model = root_injector.get(
+                        EmbeddingComponent
+                    ).embedding_model
+                    query_vector = await run_in_threadpool(
+                        embedding_model.get_query_embedding, query_text
+                    )
+                    query_scope = _scope_key(data)
+                    semantic_body = semantic_cache.lookup(query_vector, query_scope)
+                    if semantic_body is not None:
+                        logger.debug(
+                            "Serving response from semantic cache for path=%s",
+                            request.url.path,
+                        )
+                        return Response(
+                            content=semantic_body, media_type="application/json"
+                        )
+
+            response = await call_next(request)
+            if response.status_code == 200 and response.headers.get(
+                "content-type", ""
+            ).startswith("application/json"):
+                response_body = b"".join(
+                    [chunk async for chunk in response.body_iterator]
+                )
+                await response_cache.put(key, response_body)
+                if query_vector is not None:
+                    semantic_cache.add(query_vector, response_body, query_scope)
+                return Response(
+                    content=response_body,
+                    status_code=response.status_code,
+                    headers=dict(response.headers),
+                    media_type=response.media_type,
+                )
+            return response
+
+    if settings_snap.compression_enabled:
+        logger.debug("Setting up gzip compression middleware")
+        from private_gpt.server.utils.compression import SelectiveGZipMiddleware
+
         app.add_middleware(
-            CORSMiddleware,
-            allow_credentials=settings.server.cors.allow_credentials,
-            allow_origins=settings.server.cors.allow_origins,
-            allow_origin_regex=settings.server.cors.allow_origin_regex,
-            allow_methods=settings.server.cors.allow_methods,
-            allow_headers=settings.server.cors.allow_headers,
+            SelectiveGZipMiddleware,
+            # These endpoints can answer with an SSE stream when stream=true
+            excluded_paths=(
+                "/v1/completions",
+                "/v1/chat/completions",
+                "/v1/summarize",
+            ),
         )
 
-    if settings.ui.enabled:
-        logger.debug("Importing the UI module")
-        try:
-            from private_gpt.ui.ui import PrivateGptUi
-        except ImportError as e:
-            raise ImportError(
-                "UI dependencies not found, install with `poetry install --extras ui`"
-            ) from e
-
-        ui = root_injector.get(PrivateGptUi)
-        ui.mount_in_app(app, settings.ui.path)
+    if settings_snap.cors_enabled:
+        cors = settings.server.cors
+        if (
+            cors.allow_origins == ["*"]
+            and not cors.allow_credentials
+            and not cors.allow_origin_regex
+        ):
+            # Allow-all without credentials: the response headers are the
+            # same constants for every request, skip the full middleware
+            logger.debug("Setting up fast-path CORS middleware")
+            from private_gpt.server.utils.cors import FastCORS
+
+            app.add_middleware(
+                FastCORS,
+                allow_methods=cors.allow_methods,
+                allow_headers=cors.allow_headers,
+            )
+        else:
+            logger.debug("Setting up CORS middleware")
+            app.add_middleware(
+                CORSMiddleware,
+                allow_credentials=cors.allow_credentials,
+                allow_origins=cors.allow_origins,
+                allow_origin_regex=cors.allow_origin_regex,
+                allow_methods=cors.allow_methods,
+                allow_headers=cors.allow_headers,
+            )
+
+    if settings_snap.ui_enabled:
+        # The UI (gradio import + Blocks build) is deferred to the first
+        # request that actually targets it, keeping it off the startup
+        # critical path of API-only usage.
+        ui_path = settings_snap.ui_path
+        ui_mount_lock = asyncio.Lock()
+        app.state.ui = None
+
+        api_prefixes = ("/v1", "/health", "/docs", "/redoc", "/openapi.json")
+
+        def _is_ui_request(path: str) -> bool:
+            if ui_path.rstrip("/"):
+                return path == ui_path or path.startswith(ui_path.rstrip("/") + "/")
+            # UI mounted at the root: everything that is not an API route
+            return not path.startswith(api_prefixes)
+
+        @app.middleware("http")
+        async def mount_ui_on_first_request(request: Request, call_next):  # type: ignore[no-untyped-def]
+            if app.state.ui is None and _is_ui_request(request.url.path):
+                async with ui_mount_lock:
+                    if app.state.ui is None:
+                        logger.debug("Importing the UI module")
+                        try:
+                            from private_gpt.ui.ui import PrivateGptUi
+                        except ImportError as e:
+                            raise ImportError(
+                                "UI dependencies not found, install with `poetry install --extras ui`"
+                            ) from e
+
+                        ui = root_injector.get(PrivateGptUi)
+                        ui.mount_in_app(app, ui_path)
+                        # mount_gradio_app hooks the queue startup into the
+                        # app's lifespan, which already ran by the time we
+                        # mount; fire it explicitly or queued UI events
+                        # would wait on /queue/join forever
+                        ui.get_ui_blocks().startup_events()
+                        app.state.ui = ui
+            return await call_next(request)
 
     return app
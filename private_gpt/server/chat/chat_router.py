@@ -10,8 +10,8 @@ from private_gpt.open_ai.openai_models import (
     to_openai_response,
     to_openai_sse_stream,
 )
-from private_gpt.server.chat.chat_service import ChatService
 from private_gpt.server.utils.auth import authenticated
+from private_gpt.server.utils.services import get_chat_service
 
 chat_router = APIRouter(prefix="/v1", dependencies=[Depends(authenticated)])
 
@@ -87,10 +87,23 @@ def chat_completion(
     "finish_reason":null}]}
     ```
     """
-    service = request.state.injector.get(ChatService)
+    service = get_chat_service(request)
     all_messages = [
         ChatMessage(content=m.content, role=MessageRole(m.role)) for m in body.messages
     ]
+    if body.use_context:
+        # Kick off the vector search now so it overlaps with prompt and
+        # engine setup; the engine's own retrieve() joins the same lookup
+        last_user_message = next(
+            (
+                m.content
+                for m in reversed(all_messages)
+                if m.role == MessageRole.USER and m.content
+            ),
+            None,
+        )
+        if last_user_message:
+            service.warm_retrieval(last_user_message, body.context_filter)
     if body.stream:
         completion_gen = service.stream_chat(
             messages=all_messages,
@@ -1,3 +1,6 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -13,6 +16,7 @@ from llama_index.core.postprocessor import (
     SentenceTransformerRerank,
     SimilarityPostprocessor,
 )
+from llama_index.core.retrievers import BaseRetriever
 from llama_index.core.storage import StorageContext
 from llama_index.core.types import TokenGen
 from pydantic import BaseModel
@@ -20,6 +24,9 @@ from pydantic import BaseModel
 from private_gpt.components.embedding.embedding_component import EmbeddingComponent
 from private_gpt.components.llm.llm_component import LLMComponent
 from private_gpt.components.node_store.node_store_component import NodeStoreComponent
+from private_gpt.components.vector_store.retrieval_cache import (
+    RetrievalCacheComponent,
+)
 from private_gpt.components.vector_store.vector_store_component import (
     VectorStoreComponent,
 )
@@ -30,6 +37,8 @@ from private_gpt.settings.settings import Settings
 if TYPE_CHECKING:
     from llama_index.core.postprocessor.types import BaseNodePostprocessor
 
+logger = logging.getLogger(__name__)
+
 
 class Completion(BaseModel):
     response: str
@@ -87,24 +96,80 @@ class ChatService:
         vector_store_component: VectorStoreComponent,
         embedding_component: EmbeddingComponent,
         node_store_component: NodeStoreComponent,
+        retrieval_cache: RetrievalCacheComponent,
     ) -> None:
         self.settings = settings
         self.llm_component = llm_component
         self.embedding_component = embedding_component
         self.vector_store_component = vector_store_component
+        self.retrieval_cache = retrieval_cache
         self.storage_context = StorageContext.from_defaults(
             vector_store=vector_store_component.vector_store,
             docstore=node_store_component.doc_store,
             index_store=node_store_component.index_store,
         )
-        self.index = VectorStoreIndex.from_vector_store(
-            vector_store_component.vector_store,
-            storage_context=self.storage_context,
-            llm=llm_component.llm,
-            embed_model=embedding_component.embedding_model,
-            show_progress=True,
+        # Built lazily: basic chat never touches the vector index
+        self._index: VectorStoreIndex | None = None
+        self._index_lock = threading.Lock()
+        self._warm_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="retrieval-warm"
         )
 
+    @property
+    def index(self) -> VectorStoreIndex:
+        with self._index_lock:
+            if self._index is None:
+                self._index = VectorStoreIndex.from_vector_store(
+                    self.vector_store_component.vector_store,
+                    storage_context=self.storage_context,
+                    llm=self.llm_component.llm,
+                    embed_model=self.embedding_component.embedding_model,
+                    show_progress=True,
+                )
+            return self._index
+
+    def _build_retriever(
+        self, context_filter: ContextFilter | None = None
+    ) -> BaseRetriever:
+        vector_index_retriever: BaseRetriever = (
+            self.vector_store_component.get_retriever(
+                index=self.index,
+                context_filter=context_filter,
+                similarity_top_k=self.settings.rag.similarity_top_k,
+            )
+        )
+        if self.settings.cache.retrieval_cache_enabled:
+            vector_index_retriever = self.retrieval_cache.wrap(
+                vector_index_retriever, context_filter=context_filter
+            )
+        return vector_index_retriever
+
+    def warm_retrieval(
+        self, text: str, context_filter: ContextFilter | None = None
+    ) -> None:
+        """Start retrieving for `text` in the background.
+
+        Called when a request arrives, before the chat engine is built, so
+        the vector search overlaps with prompt and engine setup instead of
+        running after them. The retrieval cache deduplicates in-flight
+        lookups, so the engine's own retrieve() call joins this one rather
+        than searching twice. A no-op unless the retrieval cache is
+        enabled, given that there is nowhere to hand the result over
+        otherwise.
+        """
+        if not self.settings.cache.retrieval_cache_enabled:
+            return
+
+        def _warm() -> None:
+            try:
+                self._build_retriever(context_filter).retrieve(text)
+            except Exception:
+                # Speculative work only: the foreground retrieval will
+                # surface any real error
+                logger.debug("Speculative retrieval failed", exc_info=True)
+
+        self._warm_executor.submit(_warm)
+
     def _chat_engine(
         self,
         system_prompt: str | None = None,
@@ -113,10 +178,8 @@ class ChatService:
     ) -> BaseChatEngine:
         settings = self.settings
         if use_context:
-            vector_index_retriever = self.vector_store_component.get_retriever(
-                index=self.index,
-                context_filter=context_filter,
-                similarity_top_k=self.settings.rag.similarity_top_k,
+            vector_index_retriever = self._build_retriever(
+                context_filter=context_filter
             )
             node_postprocessors: list[BaseNodePostprocessor] = [
                 MetadataReplacementPostProcessor(target_metadata_key="window"),
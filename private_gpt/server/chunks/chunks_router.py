@@ -4,8 +4,9 @@ from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel, Field
 
 from private_gpt.open_ai.extensions.context_filter import ContextFilter
-from private_gpt.server.chunks.chunks_service import Chunk, ChunksService
+from private_gpt.server.chunks.chunks_service import Chunk
 from private_gpt.server.utils.auth import authenticated
+from private_gpt.server.utils.services import get_chunks_service
 
 chunks_router = APIRouter(prefix="/v1", dependencies=[Depends(authenticated)])
 
@@ -44,7 +45,7 @@ def chunks_retrieval(request: Request, body: ChunksBody) -> ChunksResponse:
     `/ingest/list` endpoint. If you want all ingested documents to be used,
     remove `context_filter` altogether.
     """
-    service = request.state.injector.get(ChunksService)
+    service = get_chunks_service(request)
     results = service.retrieve_relevant(
         body.text, body.context_filter, body.limit, body.prev_next_chunks
     )
@@ -3,11 +3,9 @@ from typing import Literal
 from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel
 
-from private_gpt.server.embeddings.embeddings_service import (
-    Embedding,
-    EmbeddingsService,
-)
+from private_gpt.server.embeddings.embeddings_service import Embedding
 from private_gpt.server.utils.auth import authenticated
+from private_gpt.server.utils.services import get_embeddings_service
 
 embeddings_router = APIRouter(prefix="/v1", dependencies=[Depends(authenticated)])
 
@@ -29,7 +27,7 @@ def embeddings_generation(request: Request, body: EmbeddingsBody) -> EmbeddingsR
     That vector representation can be easily consumed
     by machine learning models and algorithms.
     """
-    service = request.state.injector.get(EmbeddingsService)
+    service = get_embeddings_service(request)
     input_texts = body.input if isinstance(body.input, list) else [body.input]
     embeddings = service.texts_embeddings(input_texts)
     return EmbeddingsResponse(object="list", model="private-gpt", data=embeddings)
@@ -3,9 +3,9 @@ from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
 from pydantic import BaseModel, Field
 
-from private_gpt.server.ingest.ingest_service import IngestService
 from private_gpt.server.ingest.model import IngestedDoc
 from private_gpt.server.utils.auth import authenticated
+from private_gpt.server.utils.services import get_ingest_service
 
 ingest_router = APIRouter(prefix="/v1", dependencies=[Depends(authenticated)])
 
@@ -54,7 +54,7 @@ def ingest_file(request: Request, file: UploadFile) -> IngestResponse:
     can be used to filter the context used to create responses in
     `/chat/completions`, `/completions`, and `/chunks` APIs.
     """
-    service = request.state.injector.get(IngestService)
+    service = get_ingest_service(request)
     if file.filename is None:
         raise HTTPException(400, "No file name provided")
     ingested_documents = service.ingest_bin_data(file.filename, file.file)
@@ -74,7 +74,7 @@ def ingest_text(request: Request, body: IngestTextBody) -> IngestResponse:
     can be used to filter the context used to create responses in
     `/chat/completions`, `/completions`, and `/chunks` APIs.
     """
-    service = request.state.injector.get(IngestService)
+    service = get_ingest_service(request)
     if len(body.file_name) == 0:
         raise HTTPException(400, "No file name provided")
     ingested_documents = service.ingest_text(body.file_name, body.text)
@@ -88,7 +88,7 @@ def list_ingested(request: Request) -> IngestResponse:
     Those IDs can be used to filter the context used to create responses
     in `/chat/completions`, `/completions`, and `/chunks` APIs.
     """
-    service = request.state.injector.get(IngestService)
+    service = get_ingest_service(request)
     ingested_documents = service.list_ingested()
     return IngestResponse(object="list", model="private-gpt", data=ingested_documents)
 
@@ -100,5 +100,5 @@ def delete_ingested(request: Request, doc_id: str) -> None:
     The `doc_id` can be obtained from the `GET /ingest/list` endpoint.
     The document will be effectively deleted from your storage context.
     """
-    service = request.state.injector.get(IngestService)
+    service = get_ingest_service(request)
     service.delete(doc_id)
@@ -1,4 +1,5 @@
 import logging
+import shutil
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, AnyStr, BinaryIO
@@ -12,10 +13,14 @@ from private_gpt.components.embedding.embedding_component import EmbeddingCompon
 from private_gpt.components.ingest.ingest_component import get_ingestion_component
 from private_gpt.components.llm.llm_component import LLMComponent
 from private_gpt.components.node_store.node_store_component import NodeStoreComponent
+from private_gpt.components.vector_store.retrieval_cache import (
+    RetrievalCacheComponent,
+)
 from private_gpt.components.vector_store.vector_store_component import (
     VectorStoreComponent,
 )
 from private_gpt.server.ingest.model import IngestedDoc
+from private_gpt.server.utils.response_cache import ResponseCacheComponent
 from private_gpt.settings.settings import settings
 
 if TYPE_CHECKING:
@@ -33,8 +38,12 @@ class IngestService:
         vector_store_component: VectorStoreComponent,
         embedding_component: EmbeddingComponent,
         node_store_component: NodeStoreComponent,
+        retrieval_cache: RetrievalCacheComponent,
+        response_cache: ResponseCacheComponent,
     ) -> None:
         self.llm_service = llm_component
+        self.retrieval_cache = retrieval_cache
+        self.response_cache = response_cache
         self.storage_context = StorageContext.from_defaults(
             vector_store=vector_store_component.vector_store,
             docstore=node_store_component.doc_store,
@@ -70,6 +79,8 @@ class IngestService:
         logger.info("Ingesting file_name=%s", file_name)
         documents = self.ingest_component.ingest(file_name, file_data)
         logger.info("Finished ingestion file_name=%s", file_name)
+        self.retrieval_cache.clear()
+        self.response_cache.invalidate()
         return [IngestedDoc.from_document(document) for document in documents]
 
     def ingest_text(self, file_name: str, text: str) -> list[IngestedDoc]:
@@ -80,8 +91,17 @@ class IngestService:
         self, file_name: str, raw_file_data: BinaryIO
     ) -> list[IngestedDoc]:
         logger.debug("Ingesting binary data with file_name=%s", file_name)
-        file_data = raw_file_data.read()
-        return self._ingest_data(file_name, file_data)
+        # Stream straight into the tmp file in 1 MiB chunks instead of
+        # buffering the whole upload in memory first.
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            try:
+                path_to_tmp = Path(tmp.name)
+                shutil.copyfileobj(raw_file_data, tmp, length=1024 * 1024)
+                tmp.flush()
+                return self.ingest_file(file_name, path_to_tmp)
+            finally:
+                tmp.close()
+                path_to_tmp.unlink()
     
     def ingest_excel(self, file_name: str, excel_data: BinaryIO) -> list[IngestedDoc]:
         logger.debug("Ingesting Excel data with file_name=%s", file_name)
@@ -92,6 +112,8 @@ class IngestService:
         logger.info("Ingesting file_names=%s", [f[0] for f in files])
         documents = self.ingest_component.bulk_ingest(files)
         logger.info("Finished ingestion file_name=%s", [f[0] for f in files])
+        self.retrieval_cache.clear()
+        self.response_cache.invalidate()
         return [IngestedDoc.from_document(document) for document in documents]
 
     def list_ingested(self) -> list[IngestedDoc]:
@@ -129,3 +151,5 @@ class IngestService:
             "Deleting the ingested document=%s in the doc and index store", doc_id
         )
         self.ingest_component.delete(doc_id)
+        self.retrieval_cache.clear()
+        self.response_cache.invalidate()
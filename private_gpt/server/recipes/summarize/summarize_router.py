@@ -8,6 +8,7 @@ from private_gpt.open_ai.openai_models import (
 )
 from private_gpt.server.recipes.summarize.summarize_service import SummarizeService
 from private_gpt.server.utils.auth import authenticated
+from private_gpt.server.utils.services import get_summarize_service
 
 summarize_router = APIRouter(prefix="/v1", dependencies=[Depends(authenticated)])
 
@@ -57,7 +58,7 @@ def summarize(
     "finish_reason":null}]}
     ```
     """
-    service: SummarizeService = request.state.injector.get(SummarizeService)
+    service: SummarizeService = get_summarize_service(request)
 
     if body.stream:
         completion_gen = service.stream_summarize(
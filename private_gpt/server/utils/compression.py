@@ -0,0 +1,34 @@
+"""Selective gzip compression for API responses.
+
+The chunks and embeddings endpoints return JSON full of vectors and
+chunk text, which compresses 5-10x. Starlette's ``GZipMiddleware`` does
+the actual compression; this wrapper only carves out the endpoints that
+may stream Server-Sent Events, where compression would buffer the token
+stream instead of flushing each delta to the client.
+"""
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class SelectiveGZipMiddleware:
+    """GZip every response except those of the excluded (SSE) paths."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        excluded_paths: tuple[str, ...] = (),
+        minimum_size: int = 1024,
+        compresslevel: int = 6,
+    ) -> None:
+        self.app = app
+        self._excluded_paths = excluded_paths
+        self._gzip = GZipMiddleware(
+            app, minimum_size=minimum_size, compresslevel=compresslevel
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self._excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        await self._gzip(scope, receive, send)
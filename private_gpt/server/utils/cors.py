@@ -0,0 +1,60 @@
+"""Fast-path CORS for the fully-open configuration.
+
+With ``allow_origins=["*"]`` and credentials disabled — the common dev
+default — the response headers are the same constants for every request,
+yet Starlette's ``CORSMiddleware`` still walks its origin-matching and
+header-rewriting path per request. This middleware appends the constant
+header block instead and answers preflights directly; any other CORS
+configuration keeps using ``CORSMiddleware``.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALLOW_ALL_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"access-control-allow-origin", b"*"),
+    (b"vary", b"origin"),
+]
+
+
+class FastCORS:
+    """ASGI middleware emitting a constant allow-all CORS header block."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_methods: list[str],
+        allow_headers: list[str],
+    ) -> None:
+        self.app = app
+        self._preflight_headers = [
+            *_ALLOW_ALL_HEADERS,
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode()),
+            (b"access-control-allow-headers", ", ".join(allow_headers).encode()),
+            (b"access-control-max-age", b"600"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method"
+            for name, _ in scope["headers"]
+        ):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": self._preflight_headers,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message["headers"]) + _ALLOW_ALL_HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
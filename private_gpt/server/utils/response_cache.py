@@ -0,0 +1,179 @@
+"""Process-local cache for the completion endpoints.
+
+Identical (non-streaming) chat/completion requests short-circuit the whole
+retrieval + LLM pipeline and are served straight from memory. Entries are
+keyed on the normalized request body plus an epoch counter that is bumped
+on every ingestion write, so answers never outlive the corpus they were
+computed from.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from injector import inject, singleton
+
+from private_gpt.settings.settings import Settings
+from private_gpt.utils.hashing import content_key_hex
+
+if TYPE_CHECKING:
+    from private_gpt.server.utils.semantic_cache import SemanticQueryCache
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with per-entry TTL for serialized responses."""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: int = 3600) -> None:
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._epoch = 0
+
+    @staticmethod
+    def _normalized_body(body: bytes) -> str:
+        """Re-serialize a JSON body with sorted keys.
+
+        Two requests that only differ in field ordering normalize to the
+        same string and therefore hit the same entry.
+        """
+        try:
+            normalized: Any = json.dumps(json.loads(body), sort_keys=True)
+        except ValueError:
+            # Not JSON; fall back to the raw bytes
+            normalized = body.decode(errors="replace")
+        return normalized
+
+    def make_key(self, path: str, body: bytes) -> str:
+        """Build a stable key from the request path and its JSON body.
+
+        The current epoch is part of the key, which invalidates all
+        previous entries whenever the ingested corpus changes.
+        """
+        digest_input = f"{path}|{self._epoch}|{self._normalized_body(body)}".encode()
+        return content_key_hex(digest_input)
+
+    async def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def put(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def bump_epoch(self) -> None:
+        """Invalidate all cached responses after an ingestion write."""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+        logger.debug("Response cache invalidated, epoch=%s", self._epoch)
+
+
+class RedisResponseCache(ResponseCache):
+    """Response cache backed by Redis, shared across server processes."""
+
+    _KEY_PREFIX = "private-gpt:response:"
+
+    def __init__(
+        self, redis_url: str, max_size: int = 1024, ttl_seconds: int = 3600
+    ) -> None:
+        try:
+            import redis  # type: ignore
+            from redis import asyncio as aioredis  # type: ignore
+        except ImportError as e:
+            raise ImportError(
+                "Redis dependencies not found, install with `poetry install --extras cache-redis`"
+            ) from e
+
+        super().__init__(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._redis = aioredis.from_url(redis_url)
+        # Sync client for invalidation, which runs on the (threaded)
+        # ingestion path rather than the event loop
+        self._sync_redis = redis.Redis.from_url(redis_url)
+
+    def make_key(self, path: str, body: bytes) -> str:
+        # No epoch component: every worker must compute the same key so
+        # they share entries, and invalidation deletes the shared entries
+        # instead of rotating a per-process counter
+        return content_key_hex(f"{path}|{self._normalized_body(body)}".encode())
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._redis.get(self._KEY_PREFIX + key)
+
+    async def put(self, key: str, value: bytes) -> None:
+        await self._redis.set(self._KEY_PREFIX + key, value, ex=self._ttl_seconds)
+
+    def bump_epoch(self) -> None:
+        """Delete the shared entries so every worker sees the invalidation."""
+        batch: list[bytes] = []
+        for key in self._sync_redis.scan_iter(match=self._KEY_PREFIX + "*"):
+            batch.append(key)
+            if len(batch) >= 500:
+                self._sync_redis.delete(*batch)
+                batch.clear()
+        if batch:
+            self._sync_redis.delete(*batch)
+        logger.debug("Redis response cache invalidated")
+
+
+@singleton
+class ResponseCacheComponent:
+    """Owns the response cache and its semantic tier.
+
+    Resolved through the injector so that the HTTP middleware and the
+    ingest service share the same instances: an ingestion write, whether
+    it arrives over HTTP or through the UI, invalidates exactly the
+    caches the middleware serves from.
+    """
+
+    response_cache: ResponseCache | None
+    semantic_cache: "SemanticQueryCache | None"
+
+    @inject
+    def __init__(self, settings: Settings) -> None:
+        cache_settings = settings.cache
+        self.response_cache = None
+        self.semantic_cache = None
+        if not cache_settings.response_cache_enabled:
+            return
+        if cache_settings.redis_url:
+            self.response_cache = RedisResponseCache(
+                redis_url=cache_settings.redis_url,
+                max_size=cache_settings.response_cache_size,
+                ttl_seconds=cache_settings.response_cache_ttl,
+            )
+        else:
+            self.response_cache = ResponseCache(
+                max_size=cache_settings.response_cache_size,
+                ttl_seconds=cache_settings.response_cache_ttl,
+            )
+        if cache_settings.semantic_cache_enabled:
+            from private_gpt.server.utils.semantic_cache import SemanticQueryCache
+
+            self.semantic_cache = SemanticQueryCache(
+                max_size=cache_settings.semantic_cache_size,
+                threshold=cache_settings.semantic_threshold,
+            )
+
+    def invalidate(self) -> None:
+        """Drop all cached answers after the ingested corpus changed."""
+        if self.response_cache is not None:
+            self.response_cache.bump_epoch()
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
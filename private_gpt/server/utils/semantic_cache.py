@@ -0,0 +1,99 @@
+"""Semantic tier of the response cache.
+
+Where the exact-match cache only catches byte-identical requests, this tier
+embeds the incoming query once and compares it against the embeddings of
+recently answered queries. Paraphrases ("how do I X?" vs "what's the way
+to X?") whose cosine similarity clears the configured threshold reuse the
+stored answer, replacing retrieval + generation with a single embedding
+forward pass and one matrix-vector product.
+
+Matches are partitioned by a scope key — everything besides the query
+wording that changes the answer (system prompt, context usage, document
+filter) — so a query scoped to one document can never be answered with
+the response cached for another.
+"""
+
+import logging
+import threading
+from collections.abc import Hashable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Scope buffers start small and double up to max_size as they fill, so
+# rarely-used scopes do not each pin a full-size vector block
+_INITIAL_CAPACITY = 256
+
+
+class _ScopeBuffer:
+    """Ring buffer of normalized query embeddings for one scope."""
+
+    __slots__ = ("answers", "next_slot", "vectors")
+
+    def __init__(self, dim: int, capacity: int) -> None:
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.answers: list[bytes] = []
+        self.next_slot = 0
+
+
+class SemanticQueryCache:
+    """Thread-safe per-scope ring buffers of query embeddings and answers."""
+
+    def __init__(self, max_size: int = 10_000, threshold: float = 0.95) -> None:
+        self._max_size = max_size
+        self._threshold = threshold
+        self._lock = threading.Lock()
+        self._buffers: dict[Hashable, _ScopeBuffer] = {}
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm > 0 else array
+
+    def lookup(self, vector: list[float], scope: Hashable) -> bytes | None:
+        """Return the stored answer of the closest query in the same scope."""
+        query = self._normalize(vector)
+        with self._lock:
+            buffer = self._buffers.get(scope)
+            if buffer is None or not buffer.answers:
+                return None
+            scores = buffer.vectors[: len(buffer.answers)] @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self._threshold:
+                return None
+            logger.debug("Semantic cache hit with score=%s", scores[best])
+            return buffer.answers[best]
+
+    def add(self, vector: list[float], answer: bytes, scope: Hashable) -> None:
+        query = self._normalize(vector)
+        with self._lock:
+            buffer = self._buffers.get(scope)
+            if buffer is None:
+                buffer = _ScopeBuffer(
+                    query.shape[0], min(_INITIAL_CAPACITY, self._max_size)
+                )
+                self._buffers[scope] = buffer
+            capacity = buffer.vectors.shape[0]
+            if len(buffer.answers) == capacity and capacity < self._max_size:
+                new_capacity = min(capacity * 2, self._max_size)
+                grown = np.zeros(
+                    (new_capacity, buffer.vectors.shape[1]), dtype=np.float32
+                )
+                grown[:capacity] = buffer.vectors
+                buffer.vectors = grown
+                buffer.next_slot = capacity
+            slot = buffer.next_slot
+            buffer.vectors[slot] = query
+            if slot < len(buffer.answers):
+                buffer.answers[slot] = answer
+            else:
+                buffer.answers.append(answer)
+            # Ring buffer: the oldest entry is overwritten once full
+            buffer.next_slot = (slot + 1) % buffer.vectors.shape[0]
+
+    def clear(self) -> None:
+        """Drop all entries, e.g. after the ingested corpus changed."""
+        with self._lock:
+            self._buffers.clear()
@@ -0,0 +1,46 @@
+"""Per-application service lookups for the request hot path.
+
+Routers used to resolve their services through ``request.state.injector``
+on every request, walking the injector graph each time. All of these
+services are singletons, so the first lookup memoizes the instance on
+``app.state`` and every later request is a plain attribute read. The
+injector itself stays bound to each request for the rarely used
+dependencies.
+"""
+
+from fastapi import Request
+
+from private_gpt.server.chat.chat_service import ChatService
+from private_gpt.server.chunks.chunks_service import ChunksService
+from private_gpt.server.embeddings.embeddings_service import EmbeddingsService
+from private_gpt.server.ingest.ingest_service import IngestService
+from private_gpt.server.recipes.summarize.summarize_service import SummarizeService
+from private_gpt.utils.typing import T
+
+
+def _get_cached_service(request: Request, service_cls: type[T], attr: str) -> T:
+    service = getattr(request.app.state, attr, None)
+    if service is None:
+        service = request.state.injector.get(service_cls)
+        setattr(request.app.state, attr, service)
+    return service  # type: ignore[no-any-return]
+
+
+def get_chat_service(request: Request) -> ChatService:
+    return _get_cached_service(request, ChatService, "chat_service")
+
+
+def get_chunks_service(request: Request) -> ChunksService:
+    return _get_cached_service(request, ChunksService, "chunks_service")
+
+
+def get_embeddings_service(request: Request) -> EmbeddingsService:
+    return _get_cached_service(request, EmbeddingsService, "embeddings_service")
+
+
+def get_ingest_service(request: Request) -> IngestService:
+    return _get_cached_service(request, IngestService, "ingest_service")
+
+
+def get_summarize_service(request: Request) -> SummarizeService:
+    return _get_cached_service(request, SummarizeService, "summarize_service")
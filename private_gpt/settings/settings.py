@@ -45,6 +45,78 @@ class CorsSettings(BaseModel):
     )
 
 
+class CacheSettings(BaseModel):
+    """Caching configuration.
+
+    Controls the process-local response cache that short-circuits the
+    retrieval + LLM pipeline for repeated chat/completion requests.
+    """
+
+    response_cache_enabled: bool = Field(
+        description="Flag indicating if the response cache is enabled or not. "
+        "If set to True, identical non-streaming chat/completion requests are "
+        "served from memory instead of running the full pipeline.",
+        default=False,
+    )
+    response_cache_size: int = Field(
+        1024,
+        description="The maximum number of responses kept in the cache.",
+    )
+    response_cache_ttl: int = Field(
+        3600,
+        description="Time in seconds a cached response stays valid.",
+    )
+    redis_url: str | None = Field(
+        None,
+        description="Redis URL to back the response cache with, making it shared "
+        "across server processes. Example: 'redis://localhost:6379/0'. "
+        "If not set, an in-process cache is used.",
+    )
+    semantic_cache_enabled: bool = Field(
+        description="Flag indicating if the semantic cache tier is enabled or not. "
+        "If set to True, chat queries whose embedding is close enough to a "
+        "recently answered one reuse the stored answer. "
+        "Requires the response cache to be enabled.",
+        default=False,
+    )
+    semantic_threshold: float = Field(
+        0.95,
+        description="Minimum cosine similarity between query embeddings for a "
+        "cached answer to be reused. Acceptable values are between 0 and 1.",
+    )
+    semantic_cache_size: int = Field(
+        10_000,
+        description="The maximum number of query embeddings kept in the semantic cache.",
+    )
+    retrieval_cache_enabled: bool = Field(
+        description="Flag indicating if the chunk retrieval cache is enabled or not. "
+        "If set to True, the chunks retrieved for a query are memoized so "
+        "repeating the query skips the query embedding and the vector store search.",
+        default=False,
+    )
+    retrieval_cache_size: int = Field(
+        512,
+        description="The maximum number of retrieval results kept in the cache.",
+    )
+    embedding_cache_enabled: bool = Field(
+        description="Flag indicating if the embedding cache is enabled or not. "
+        "If set to True, embeddings are cached by a hash of their text in "
+        "memory and in a local SQLite database, so re-ingested or repeated "
+        "text skips the embedding model entirely.",
+        default=False,
+    )
+    embedding_cache_size: int = Field(
+        50_000,
+        description="The maximum number of embeddings kept in memory. "
+        "The SQLite tier is unbounded.",
+    )
+    llama_cache_dir: str | None = Field(
+        None,
+        description="Directory to persist the llama.cpp prompt prefix cache in. "
+        "If not set, the prefix cache (when enabled) is kept in RAM only.",
+    )
+
+
 class AuthSettings(BaseModel):
     """Authentication configuration.
 
@@ -88,6 +160,18 @@ class ServerSettings(BaseModel):
         description="Name of the environment (prod, staging, local...)"
     )
     port: int = Field(description="Port of PrivateGPT FastAPI server, defaults to 8001")
+    prod: bool = Field(
+        description="Flag indicating if the server runs in production mode. "
+        "If set to True, uvicorn uses the uvloop event loop and the httptools "
+        "HTTP parser, and the per-request access log is disabled.",
+        default=False,
+    )
+    compression_enabled: bool = Field(
+        False,
+        description="Enable gzip compression of API responses. Vector and "
+        "chunk payloads compress 5-10x; streaming (SSE) endpoints are "
+        "excluded so the token stream is not buffered.",
+    )
     cors: CorsSettings = Field(
         description="CORS configuration", default=CorsSettings(enabled=False)
     )
@@ -139,6 +223,14 @@ class LLMSettings(BaseModel):
         0.1,
         description="The temperature of the model. Increasing the temperature will make the model answer more creatively. A value of 0.1 would be more factual.",
     )
+    prefix_cache_enabled: bool = Field(
+        False,
+        description="Flag indicating if prompt prefix caching is enabled or not. "
+        "If set to True and the `llamacpp` mode is used, the KV state of "
+        "previously evaluated prompt prefixes (e.g. the system prompt) is kept "
+        "so identical prefixes skip prefill. Other modes run the LLM behind an "
+        "API, where prefix caching is a server-side concern.",
+    )
     prompt_style: Literal["default", "llama2", "llama3", "tag", "mistral", "chatml"] = (
         Field(
             "llama2",
@@ -239,6 +331,18 @@ class EmbeddingSettings(BaseModel):
         384,
         description="The dimension of the embeddings stored in the Postgres database",
     )
+    embed_batch_size: int = Field(
+        64,
+        description="Number of texts sent to the embedding model in one call. "
+        "Batching amortizes the per-call overhead and keeps the model busy; "
+        "it matters most when ingesting many chunks at once.",
+    )
+    cache_dtype: Literal["float32", "float16", "int8"] = Field(
+        "float16",
+        description="Storage dtype for vectors in the embedding cache. "
+        "`int8` quantizes with a per-vector scale (4x smaller than float32, "
+        "negligible recall loss); `float32` keeps full precision.",
+    )
 
 
 class SagemakerSettings(BaseModel):
@@ -610,6 +714,7 @@ class Settings(BaseModel):
     nodestore: NodeStoreSettings
     rag: RagSettings
     summarize: SummarizeSettings
+    cache: CacheSettings = Field(default_factory=CacheSettings)
     qdrant: QdrantSettings | None = None
     postgres: PostgresSettings | None = None
     clickhouse: ClickHouseSettings | None = None
@@ -0,0 +1,49 @@
+"""Read-only snapshot of the settings read on request hot paths.
+
+Attribute access on the Pydantic ``Settings`` model goes through model
+descriptors, which is measurably slower than a plain attribute load. The
+fields that middlewares and per-request guards actually read are copied
+once at app creation into this frozen, slotted dataclass and served from
+``app.state`` afterwards.
+"""
+
+from dataclasses import dataclass
+
+from private_gpt.settings.settings import Settings
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    cors_enabled: bool
+    compression_enabled: bool
+    ui_enabled: bool
+    ui_path: str
+    prefix_cache_enabled: bool
+    response_cache_enabled: bool
+    response_cache_size: int
+    response_cache_ttl: int
+    redis_url: str | None
+    semantic_cache_enabled: bool
+    semantic_threshold: float
+    semantic_cache_size: int
+    retrieval_cache_enabled: bool
+    embedding_cache_enabled: bool
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SettingsSnapshot":
+        return cls(
+            cors_enabled=settings.server.cors.enabled,
+            compression_enabled=settings.server.compression_enabled,
+            ui_enabled=settings.ui.enabled,
+            ui_path=settings.ui.path,
+            prefix_cache_enabled=settings.llm.prefix_cache_enabled,
+            response_cache_enabled=settings.cache.response_cache_enabled,
+            response_cache_size=settings.cache.response_cache_size,
+            response_cache_ttl=settings.cache.response_cache_ttl,
+            redis_url=settings.cache.redis_url,
+            semantic_cache_enabled=settings.cache.semantic_cache_enabled,
+            semantic_threshold=settings.cache.semantic_threshold,
+            semantic_cache_size=settings.cache.semantic_cache_size,
+            retrieval_cache_enabled=settings.cache.retrieval_cache_enabled,
+            embedding_cache_enabled=settings.cache.embedding_cache_enabled,
+        )
@@ -2,19 +2,20 @@
 
 import base64
 import logging
-import time
-from collections.abc import Iterable
+import types
+from collections.abc import Iterable, Mapping
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 import gradio as gr  # type: ignore
 from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
 from gradio.themes.utils import colors, fonts, sizes # type: ignore
 from injector import inject, singleton
 from llama_index.core.llms import ChatMessage, ChatResponse, MessageRole
 from llama_index.core.types import TokenGen
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from private_gpt.constants import PROJECT_ROOT_PATH
 from private_gpt.di import global_injector
@@ -36,6 +37,33 @@ UI_TAB_TITLE = "FPT Digital AI Assistant"
 
 SOURCES_SEPARATOR = "<hr>Sources: \n"
 
+# Number of ingested files shown at once; keeps the rendered list (and the
+# payload of every Gradio round-trip) proportional to the page, not the corpus
+FILES_PAGE_SIZE = 50
+
+UI_STATIC_PATH = "/ui-static"
+UI_STATIC_DIRECTORY = Path(__file__).parent / "static"
+
+# Built once at import time instead of re-interpolated per session build
+_STYLESHEET_HTML = f"<link rel='stylesheet' href='{UI_STATIC_PATH}/app.css'>"
+_HEADER_HTML = (
+    f"<div class='logo'/><img src={logo_fpt_assistant} "
+    "alt=FPT Digital AI Assistant></div"
+)
+
+
+class CachedStaticFiles(StaticFiles):
+    """Static files with aggressive browser caching.
+
+    The UI assets are immutable per deployment, so the browser fetches
+    them once instead of on every page load.
+    """
+
+    def file_response(self, *args: Any, **kwargs: Any) -> Any:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 
 class Modes(str, Enum):
     RAG_MODE = "RAG"
@@ -57,8 +85,7 @@ class Source(BaseModel):
     page: str
     text: str
 
-    class Config:
-        frozen = True
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     @staticmethod
     def curate_sources(sources: list[Chunk]) -> list["Source"]:
@@ -98,6 +125,7 @@ class PrivateGptUi:
         self._ui_block = None
 
         self._selected_filename = None
+        self._files_page = 0
 
         # Initialize system prompt based on default mode
         default_mode_map = {mode.value: mode for mode in Modes}
@@ -106,6 +134,18 @@ class PrivateGptUi:
         )
         self._system_prompt = self._get_default_system_prompt(self._default_mode)
 
+        # Frozen once: switching modes becomes a dict lookup instead of
+        # re-deriving the prompt and explanation from settings every time
+        self._mode_defaults: Mapping[Modes, tuple[str, str]] = types.MappingProxyType(
+            {
+                mode: (
+                    self._get_default_system_prompt(mode),
+                    self._get_default_mode_explanation(mode),
+                )
+                for mode in MODES
+            }
+        )
+
     def _chat(
         self, message: str, history: list[list[str]], mode: Modes, *_: Any
     ) -> Any:
@@ -118,7 +158,6 @@ class PrivateGptUi:
                 elif isinstance(delta, ChatResponse):
                     full_response += delta.delta or ""
                 yield full_response
-                time.sleep(0.02)
 
             if completion_gen.sources:
                 full_response += SOURCES_SEPARATOR
@@ -186,6 +225,8 @@ class PrivateGptUi:
                             docs_ids.append(ingested_document.doc_id)
                     context_filter = ContextFilter(docs_ids=docs_ids)
 
+                # Overlap the vector search with the engine setup
+                self._chat_service.warm_retrieval(message, context_filter)
                 query_stream = self._chat_service.stream_chat(
                     messages=all_messages,
                     use_context=True,
@@ -275,15 +316,16 @@ class PrivateGptUi:
 
     def _set_current_mode(self, mode: Modes) -> Any:
         self.mode = mode
-        self._set_system_prompt(self._get_default_system_prompt(mode))
-        self._set_explanatation_mode(self._get_default_mode_explanation(mode))
+        default_prompt, explanation = self._mode_defaults[mode]
+        self._set_system_prompt(default_prompt)
+        self._set_explanatation_mode(explanation)
         interactive = self._system_prompt is not None
         return [
             gr.update(placeholder=self._system_prompt, interactive=interactive),
             gr.update(value=self._explanation_mode),
         ]
 
-    def _list_ingested_files(self) -> list[list[str]]:
+    def _ingested_file_names(self) -> list[str]:
         files = set()
         for ingested_document in self._ingest_service.list_ingested():
             if ingested_document.doc_metadata is None:
@@ -293,7 +335,24 @@ class PrivateGptUi:
                 "file_name", "[FILE NAME MISSING]"
             )
             files.add(file_name)
-        return [[row] for row in files]
+        # Sorted so pagination windows are stable across round-trips
+        return sorted(files)
+
+    def _list_ingested_files(self) -> list[list[str]]:
+        files = self._ingested_file_names()
+        last_page = max(0, (len(files) - 1) // FILES_PAGE_SIZE)
+        self._files_page = min(self._files_page, last_page)
+        start = self._files_page * FILES_PAGE_SIZE
+        return [[row] for row in files[start : start + FILES_PAGE_SIZE]]
+
+    def _previous_files_page(self) -> list[list[str]]:
+        self._files_page = max(0, self._files_page - 1)
+        return self._list_ingested_files()
+
+    def _next_files_page(self) -> list[list[str]]:
+        self._files_page += 1
+        # _list_ingested_files clamps to the last page
+        return self._list_ingested_files()
 
     def _upload_file(self, files: list[str]) -> None:
         logger.debug("Loading count=%s files", len(files))
@@ -364,71 +423,21 @@ class PrivateGptUi:
             gr.components.Textbox(self._selected_filename),
         ]
 
-    def _build_ui_blocks(self) -> gr.Blocks:
+    def _build_ui_blocks(self, inline_css: bool = False) -> gr.Blocks:
         logger.debug("Creating the UI blocks")
         with gr.Blocks(
             title=UI_TAB_TITLE,
             theme=gr.themes.Soft(primary_hue='cyan', secondary_hue="cyan",neutral_hue ='cyan'),
-            css="""
-.image {
-    display: flex;
-    background-color:rgb(22, 37, 112);
-    height: 80px;
-    border-radius: 8px;
-    align-content: center;
-    justify-content: center;
-    align-items: center;
-}
-
-.logo img {
-    
-    width: 20%;
-    margin-left: auto;
-    margin-right: auto;
-
-}
-
-.contain {
-    display: flex !important;
-    flex-direction: column !important;
-}
-
-#component-0,
-#component-3,
-#component-10,
-#component-8 {
-    height: 100% !important;
-}
-
-chatbot {
-    flex-grow: 1 !important;
-    overflow: auto !important;
-}
-
-col {
-    height: 100vh !important;
-}
-
-hr {
-    margin-top: 1em;
-    margin-bottom: 1em;
-    border: 0;
-    border-top: 1px solid #FFF;
-}
-
-.avatar-image {
-    /* Add specific styles here */
-}
-
-.toggle {
-    width: 5vh !important;
-    border: 5px;
-}
-
-"""
+            # Standalone launch has no static mount to link against, so the
+            # stylesheet is inlined there
+            css=(UI_STATIC_DIRECTORY / "app.css").read_text() if inline_css else None,
         ) as blocks:
+            if not inline_css:
+                # The stylesheet is served as a static asset (cached by the
+                # browser) instead of being re-sent with every Blocks page
+                gr.HTML(_STYLESHEET_HTML)
             with gr.Row():
-                gr.HTML(f"<div class='logo'/><img src={logo_fpt_assistant} alt=FPT Digital AI Assistant></div")
+                gr.HTML(_HEADER_HTML)
                 
             with gr.Row(elem_classes = "toggle"):
                 def toggle_sidebar(state):
@@ -473,6 +482,19 @@ hr {
                         outputs=ingested_dataset,
                     )
                     ingested_dataset.render()
+                    with gr.Row():
+                        previous_page_button = gr.components.Button(
+                            "◀ Prev", size="sm"
+                        )
+                        next_page_button = gr.components.Button("Next ▶", size="sm")
+                    previous_page_button.click(
+                        self._previous_files_page,
+                        outputs=ingested_dataset,
+                    )
+                    next_page_button.click(
+                        self._next_files_page,
+                        outputs=ingested_dataset,
+                    )
                     deselect_file_button = gr.components.Button(
                         "De-select selected file", size="sm", interactive=False
                     )
@@ -612,12 +634,17 @@ hr {
                     )
         return blocks
 
-    def get_ui_blocks(self) -> gr.Blocks:
+    def get_ui_blocks(self, inline_css: bool = False) -> gr.Blocks:
         if self._ui_block is None:
-            self._ui_block = self._build_ui_blocks()
+            self._ui_block = self._build_ui_blocks(inline_css=inline_css)
         return self._ui_block
 
     def mount_in_app(self, app: FastAPI, path: str) -> None:
+        app.mount(
+            UI_STATIC_PATH,
+            CachedStaticFiles(directory=str(UI_STATIC_DIRECTORY)),
+            name="ui-static",
+        )
         blocks = self.get_ui_blocks()
         blocks.queue()
         logger.info("Mounting the gradio UI, at path=%s", path)
@@ -625,6 +652,6 @@ hr {
 
 if __name__ == "__main__":
     ui = global_injector.get(PrivateGptUi)
-    _blocks = ui.get_ui_blocks()
+    _blocks = ui.get_ui_blocks(inline_css=True)
     _blocks.queue()
     _blocks.launch(debug=False, show_api=False)
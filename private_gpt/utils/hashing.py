@@ -0,0 +1,21 @@
+"""Content hashing helpers shared by the caching layers.
+
+All cache keys in the project are BLAKE2b digests truncated to 16 bytes:
+BLAKE2b is noticeably faster than SHA-256 on short inputs in CPython, and
+the half-size digest halves key storage while still making collisions a
+non-concern for cache lookups.
+"""
+
+import hashlib
+
+DIGEST_SIZE = 16
+
+
+def content_key(data: bytes) -> bytes:
+    """Return the 16-byte BLAKE2b digest of ``data``."""
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+
+def content_key_hex(data: bytes) -> str:
+    """Return the 16-byte BLAKE2b digest of ``data`` as a hex string."""
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
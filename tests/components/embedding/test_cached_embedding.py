@@ -0,0 +1,130 @@
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+from llama_index.core.embeddings import MockEmbedding
+from pydantic import Field
+
+from private_gpt.components.embedding.cached_embedding import CachedEmbedding
+
+DIM = 8
+
+
+class CountingEmbedding(MockEmbedding):
+    """Mock embedding that returns a distinct vector per text and counts calls."""
+
+    query_calls: int = 0
+    text_calls: int = 0
+    batched_texts: list[list[str]] = Field(default_factory=list)
+
+    @staticmethod
+    def _vector_for(text: str) -> list[float]:
+        seed = sum(text.encode())
+        return [float((seed + index) % 11) - 5.0 for index in range(DIM)]
+
+    def _get_query_embedding(self, query: str) -> list[float]:
+        self.query_calls += 1
+        return self._vector_for(query)
+
+    def _get_text_embedding(self, text: str) -> list[float]:
+        self.text_calls += 1
+        return self._vector_for(text)
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self.batched_texts = [*self.batched_texts, list(texts)]
+        return [self._vector_for(text) for text in texts]
+
+
+@pytest.fixture
+def delegate() -> CountingEmbedding:
+    return CountingEmbedding(embed_dim=DIM)
+
+
+def _db_path(tmp_path: Path) -> Path:
+    return tmp_path / "embedding_cache.db"
+
+
+def test_repeated_query_hits_the_cache(
+    tmp_path: Path, delegate: CountingEmbedding
+) -> None:
+    cache = CachedEmbedding(delegate, _db_path(tmp_path))
+    first = cache.get_query_embedding("what is private gpt?")
+    second = cache.get_query_embedding("what is private gpt?")
+    assert delegate.query_calls == 1
+    assert second == first
+
+
+def test_vectors_survive_a_restart(
+    tmp_path: Path, delegate: CountingEmbedding
+) -> None:
+    cache = CachedEmbedding(delegate, _db_path(tmp_path))
+    original = cache.get_text_embedding("some chunk")
+
+    reloaded_delegate = CountingEmbedding(embed_dim=DIM)
+    reloaded = CachedEmbedding(reloaded_delegate, _db_path(tmp_path))
+    vector = reloaded.get_text_embedding("some chunk")
+    assert reloaded_delegate.text_calls == 0
+    assert vector == pytest.approx(original, abs=1e-2)
+
+
+def test_int8_roundtrip_is_close_to_the_original(
+    tmp_path: Path, delegate: CountingEmbedding
+) -> None:
+    cache = CachedEmbedding(delegate, _db_path(tmp_path), dtype="int8")
+    original = cache.get_text_embedding("some chunk")
+
+    reloaded = CachedEmbedding(
+        CountingEmbedding(embed_dim=DIM),
+        _db_path(tmp_path),
+        dtype="int8",
+    )
+    vector = reloaded.get_text_embedding("some chunk")
+    # Worst-case SQ8 error is half a quantization step: max|v| / 127 / 2
+    assert vector == pytest.approx(original, abs=0.05)
+
+
+def test_pre_quantization_database_is_migrated(
+    tmp_path: Path, delegate: CountingEmbedding
+) -> None:
+    # Databases written before the dtype/scale columns existed hold raw
+    # float16 vectors; opening them must add the columns and keep the rows
+    legacy_vector = CountingEmbedding._vector_for("legacy chunk")
+    db = sqlite3.connect(str(_db_path(tmp_path)))
+    db.execute("CREATE TABLE embedding_cache(key BLOB PRIMARY KEY, vector BLOB)")
+    db.execute(
+        "INSERT INTO embedding_cache VALUES (?, ?)",
+        (
+            CachedEmbedding._make_key("text", "legacy chunk"),
+            np.asarray(legacy_vector, dtype=np.float16).tobytes(),
+        ),
+    )
+    db.commit()
+    db.close()
+
+    cache = CachedEmbedding(delegate, _db_path(tmp_path))
+    vector = cache.get_text_embedding("legacy chunk")
+    assert delegate.text_calls == 0
+    assert vector == pytest.approx(legacy_vector, abs=1e-2)
+
+
+def test_batch_only_embeds_the_misses(
+    tmp_path: Path, delegate: CountingEmbedding
+) -> None:
+    cache = CachedEmbedding(delegate, _db_path(tmp_path))
+    cache.get_text_embedding("chunk a")
+    vectors = cache._get_text_embeddings(["chunk a", "chunk b", "chunk c"])
+    assert delegate.batched_texts == [["chunk b", "chunk c"]]
+    assert vectors[0] == CountingEmbedding._vector_for("chunk a")
+    assert vectors[1] == CountingEmbedding._vector_for("chunk b")
+
+
+def test_memory_eviction_falls_back_to_sqlite(
+    tmp_path: Path, delegate: CountingEmbedding
+) -> None:
+    cache = CachedEmbedding(delegate, _db_path(tmp_path), mem_size=1)
+    original = cache.get_text_embedding("chunk a")
+    cache.get_text_embedding("chunk b")  # evicts "chunk a" from memory
+    vector = cache.get_text_embedding("chunk a")
+    assert delegate.text_calls == 2
+    assert vector == pytest.approx(original, abs=1e-2)
@@ -0,0 +1,35 @@
+import pytest
+from fastapi.testclient import TestClient
+
+ALLOW_ALL_CORS = {
+    "server": {
+        "cors": {
+            "enabled": True,
+            "allow_origins": ["*"],
+            "allow_methods": ["*"],
+            "allow_headers": ["*"],
+        }
+    }
+}
+
+
+@pytest.mark.parametrize("test_client", [ALLOW_ALL_CORS], indirect=True)
+def test_fast_cors_sets_allow_all_headers(test_client: TestClient) -> None:
+    response = test_client.get("/health", headers={"Origin": "http://example.com"})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "origin" in response.headers.get("vary", "")
+
+
+@pytest.mark.parametrize("test_client", [ALLOW_ALL_CORS], indirect=True)
+def test_fast_cors_answers_preflight(test_client: TestClient) -> None:
+    response = test_client.options(
+        "/v1/chat/completions",
+        headers={
+            "Origin": "http://example.com",
+            "Access-Control-Request-Method": "POST",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert response.headers["access-control-allow-methods"] == "*"
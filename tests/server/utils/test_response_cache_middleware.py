@@ -0,0 +1,91 @@
+"""Tests for the response cache middleware.
+
+Completion ids are a fresh uuid4 per generation, so two responses sharing
+an id must have come from the cache, and differing ids prove the request
+went through the full pipeline again.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from private_gpt.open_ai.openai_models import OpenAIMessage
+from private_gpt.server.chat.chat_router import ChatBody
+
+CACHE_ENABLED = {"cache": {"response_cache_enabled": True}}
+
+
+def _chat_body() -> dict:
+    return ChatBody(
+        messages=[OpenAIMessage(content="test", role="user")],
+        use_context=False,
+        stream=False,
+    ).model_dump()
+
+
+@pytest.mark.parametrize("test_client", [CACHE_ENABLED], indirect=True)
+def test_identical_requests_are_served_from_cache(test_client: TestClient) -> None:
+    first = test_client.post("/v1/chat/completions", json=_chat_body())
+    second = test_client.post("/v1/chat/completions", json=_chat_body())
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json()["id"] == first.json()["id"]
+
+
+def test_cache_is_disabled_by_default(test_client: TestClient) -> None:
+    first = test_client.post("/v1/chat/completions", json=_chat_body())
+    second = test_client.post("/v1/chat/completions", json=_chat_body())
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json()["id"] != first.json()["id"]
+
+
+@pytest.mark.parametrize("test_client", [CACHE_ENABLED], indirect=True)
+def test_non_dict_json_body_does_not_break_the_middleware(
+    test_client: TestClient,
+) -> None:
+    response = test_client.post("/v1/chat/completions", json="hello")
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("test_client", [CACHE_ENABLED], indirect=True)
+def test_ingestion_invalidates_cached_responses(test_client: TestClient) -> None:
+    first = test_client.post("/v1/chat/completions", json=_chat_body())
+    assert first.status_code == 200
+
+    ingest_response = test_client.post(
+        "/v1/ingest/text",
+        json={"file_name": "file_name", "text": "Lorem ipsum dolor sit amet"},
+    )
+    assert ingest_response.status_code == 200
+
+    second = test_client.post("/v1/chat/completions", json=_chat_body())
+    assert second.status_code == 200
+    assert second.json()["id"] != first.json()["id"]
+
+
+@pytest.mark.parametrize(
+    "test_client",
+    [
+        {
+            "server": {"auth": {"enabled": True, "secret": "test secret"}},
+            "cache": {"response_cache_enabled": True},
+        }
+    ],
+    indirect=True,
+)
+def test_cache_hits_require_authorization(test_client: TestClient) -> None:
+    # NOTE: the routers' `authenticated` dependency is bound at import time
+    # from the test profile (auth disabled), so every request still reaches
+    # the endpoint; this exercises the middleware's own header check.
+    headers = {"Authorization": "test secret"}
+    first = test_client.post("/v1/chat/completions", json=_chat_body(), headers=headers)
+    assert first.status_code == 200
+
+    # Without the header the cached answer must not be served (nor replaced)
+    unauthorized = test_client.post("/v1/chat/completions", json=_chat_body())
+    assert unauthorized.json()["id"] != first.json()["id"]
+
+    authorized = test_client.post(
+        "/v1/chat/completions", json=_chat_body(), headers=headers
+    )
+    assert authorized.json()["id"] == first.json()["id"]
@@ -0,0 +1,59 @@
+from private_gpt.server.utils.semantic_cache import SemanticQueryCache
+
+SCOPE_A = ("system prompt", True, ("doc-a",))
+SCOPE_B = ("system prompt", True, ("doc-b",))
+
+
+def _one_hot(index: int, dim: int) -> list[float]:
+    vector = [0.0] * dim
+    vector[index] = 1.0
+    return vector
+
+
+def test_close_queries_share_an_answer() -> None:
+    cache = SemanticQueryCache(max_size=10, threshold=0.9)
+    cache.add([1.0, 0.0, 0.0], b"answer", SCOPE_A)
+    # Identical direction, different magnitude: cosine similarity is 1.0
+    assert cache.lookup([2.0, 0.0, 0.0], SCOPE_A) == b"answer"
+
+
+def test_dissimilar_queries_miss() -> None:
+    cache = SemanticQueryCache(max_size=10, threshold=0.9)
+    cache.add([1.0, 0.0, 0.0], b"answer", SCOPE_A)
+    assert cache.lookup([0.0, 1.0, 0.0], SCOPE_A) is None
+
+
+def test_scopes_are_isolated() -> None:
+    cache = SemanticQueryCache(max_size=10, threshold=0.9)
+    cache.add([1.0, 0.0, 0.0], b"answer for doc-a", SCOPE_A)
+    assert cache.lookup([1.0, 0.0, 0.0], SCOPE_B) is None
+    assert cache.lookup([1.0, 0.0, 0.0], SCOPE_A) == b"answer for doc-a"
+
+
+def test_ring_buffer_overwrites_the_oldest_entry() -> None:
+    cache = SemanticQueryCache(max_size=2, threshold=0.9)
+    cache.add(_one_hot(0, 4), b"first", SCOPE_A)
+    cache.add(_one_hot(1, 4), b"second", SCOPE_A)
+    cache.add(_one_hot(2, 4), b"third", SCOPE_A)
+    assert cache.lookup(_one_hot(0, 4), SCOPE_A) is None
+    assert cache.lookup(_one_hot(1, 4), SCOPE_A) == b"second"
+    assert cache.lookup(_one_hot(2, 4), SCOPE_A) == b"third"
+
+
+def test_buffer_growth_preserves_entries() -> None:
+    # Buffers start at 256 slots; adding past that must grow, not overwrite
+    dim = 300
+    cache = SemanticQueryCache(max_size=512, threshold=0.9)
+    for index in range(dim):
+        cache.add(_one_hot(index, dim), b"answer %d" % index, SCOPE_A)
+    for index in range(dim):
+        assert cache.lookup(_one_hot(index, dim), SCOPE_A) == b"answer %d" % index
+
+
+def test_clear_drops_every_scope() -> None:
+    cache = SemanticQueryCache(max_size=10, threshold=0.9)
+    cache.add([1.0, 0.0], b"a", SCOPE_A)
+    cache.add([1.0, 0.0], b"b", SCOPE_B)
+    cache.clear()
+    assert cache.lookup([1.0, 0.0], SCOPE_A) is None
+    assert cache.lookup([1.0, 0.0], SCOPE_B) is None
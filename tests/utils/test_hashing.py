@@ -0,0 +1,15 @@
+import hashlib
+
+from private_gpt.utils.hashing import content_key, content_key_hex
+
+
+def test_content_key_is_16_byte_blake2b() -> None:
+    data = b"some content"
+    expected = hashlib.blake2b(data, digest_size=16).digest()
+    assert content_key(data) == expected
+    assert len(content_key(data)) == 16
+
+
+def test_content_key_hex_matches_content_key() -> None:
+    data = b"some content"
+    assert content_key_hex(data) == content_key(data).hex()